@@ -2,8 +2,9 @@ from pathlib import Path
 
 from cirobotix.scaffolds import ProjectScaffolder
 from core.cli.cli_args import CliArgsParser
-from core.services.work_order_cli_service import WorkOrderCliService
-from core.services.work_order_proposal_service import WorkOrderProposalService
+
+# The work order services pull in every pipeline machine and PyYAML, so the
+# run_* handlers import them when called rather than at module load.
 
 DEFAULT_PROJECT_CONFIG = "config/projects/local_project.yaml"
 DEFAULT_PROFILE = "default"
@@ -17,6 +18,8 @@ def print_step_results(step_results) -> None:
 
 
 def run_draft(args: dict) -> None:
+    from core.services.work_order_cli_service import WorkOrderCliService
+
     blueprint_name = args["blueprint"]
     target_path = args["file"]
     project_config = args.get("project", DEFAULT_PROJECT_CONFIG)
@@ -36,6 +39,8 @@ def run_draft(args: dict) -> None:
 
 
 def run_ai_draft_workorder(args: dict) -> None:
+    from core.services.work_order_proposal_service import WorkOrderProposalService
+
     task_path = args["task"]
     profile_name = args.get("profile", DEFAULT_PROFILE)
     project_config = args.get("project", DEFAULT_PROJECT_CONFIG)
@@ -52,6 +57,8 @@ def run_ai_draft_workorder(args: dict) -> None:
 
 
 def run_promote_workorder(args: dict) -> None:
+    from core.services.work_order_proposal_service import WorkOrderProposalService
+
     proposal_path = args["proposal"]
     project_config = args.get("project", DEFAULT_PROJECT_CONFIG)
 
@@ -67,6 +74,8 @@ def run_promote_workorder(args: dict) -> None:
 
 
 def run_generate(args: dict) -> None:
+    from core.services.work_order_cli_service import WorkOrderCliService
+
     work_order_path = args["work_order"]
     project_config = args.get("project", DEFAULT_PROJECT_CONFIG)
 
@@ -38,12 +38,13 @@ class ProjectScaffolder:
 
                 relative_path = src.relative_to(src_root)
                 destination = dst_root / relative_path
+                destination_exists = destination.exists()
 
-                if destination.exists() and not force:
+                if destination_exists and not force:
                     skipped.append(destination)
                     continue
 
-                if destination.exists() and force:
+                if destination_exists:
                     overwritten.append(destination)
                 else:
                     created.append(destination)
@@ -3,6 +3,14 @@ from pathlib import Path
 
 from core.models.context import ProductionContext
 
+_FILE_BLOCK_PATTERN = re.compile(
+    r"(?ms)^### FILE:\s*([^\n]+)\n"
+    r"(?:[ \t]*\n)*"
+    r"^```[a-zA-Z0-9_-]*\n"
+    r"(.*?)"
+    r"^```[ \t]*$"
+)
+
 
 class OutputApplier:
     def run(self, context: ProductionContext) -> ProductionContext:
@@ -27,16 +35,9 @@ class OutputApplier:
         return context
 
     def _extract_files(self, content: str) -> dict[str, str]:
-        pattern = (
-            r"(?ms)^### FILE:\s*(.+?)\n"
-            r"^```[a-zA-Z0-9_-]*\n"
-            r"(.*?)"
-            r"^```[ \t]*$"
-        )
-        matches = re.findall(pattern, content)
-
         files: dict[str, str] = {}
-        for path, code in matches:
+        for match in _FILE_BLOCK_PATTERN.finditer(content):
+            path, code = match.groups()
             files[path.strip()] = code.strip()
 
         if not files:
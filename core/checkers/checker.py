@@ -3,6 +3,14 @@ from pathlib import Path
 
 from core.models.context import ProductionContext
 
+_FILE_BLOCK_PATTERN = re.compile(
+    r"### FILE: ([^\n]+)\n"
+    r"(?:[ \t]*\n)*"
+    r"```(?:python)?\n"
+    r"(.*?)```",
+    re.DOTALL,
+)
+
 
 class OutputChecker:
     def run(self, context: ProductionContext) -> ProductionContext:
@@ -23,16 +31,13 @@ class OutputChecker:
         missing_files = expected_files - returned_files
         unexpected_files = returned_files - expected_files
 
-        for path in sorted(missing_files):
-            errors.append(f"Missing output file block: {path}")
-
-        for path in sorted(unexpected_files):
-            errors.append(f"Unexpected output file block: {path}")
+        errors.extend(f"Missing output file block: {path}" for path in sorted(missing_files))
+        errors.extend(f"Unexpected output file block: {path}" for path in sorted(unexpected_files))
 
         for path in sorted(expected_files & returned_files):
             code = files[path]
 
-            if not code.strip():
+            if not code:
                 errors.append(f"Empty output block for file: {path}")
                 continue
 
@@ -48,11 +53,9 @@ class OutputChecker:
         return context
 
     def _extract_files(self, content: str) -> dict[str, str]:
-        pattern = r"### FILE: (.+?)\n```(?:python)?\n(.*?)```"
-        matches = re.findall(pattern, content, re.DOTALL)
-
         files: dict[str, str] = {}
-        for path, code in matches:
+        for match in _FILE_BLOCK_PATTERN.finditer(content):
+            path, code = match.groups()
             files[path.strip()] = code.strip()
 
         return files
@@ -8,10 +8,10 @@ class CliArgsParser:
 
         parsed: dict[str, str] = {}
         for raw in raw_args:
-            if "=" not in raw:
+            key, separator, value = raw.partition("=")
+            if not separator:
                 raise ValueError(f"Argument must be key=value: {raw}")
 
-            key, value = raw.split("=", 1)
             key = key.strip()
             value = value.strip()
 
@@ -1,9 +1,11 @@
 from datetime import datetime
 from pathlib import Path
 
+_STEM_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+
 
 class RequestIdBuilder:
     def build(self, blueprint_name: str, target_path: str) -> str:
-        stem = Path(target_path).stem.replace(" ", "_").replace("-", "_")
+        stem = Path(target_path).stem.translate(_STEM_SEPARATORS)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"{blueprint_name}_{stem}_{timestamp}"
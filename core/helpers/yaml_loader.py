@@ -0,0 +1,10 @@
+from typing import Any
+
+import yaml
+
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only ship SafeLoader.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load_yaml(text: str) -> Any:
+    return yaml.load(text, Loader=YAML_SAFE_LOADER)  # nosec B506
@@ -1,7 +1,6 @@
 from pathlib import Path
 
-import yaml
-
+from core.helpers.yaml_loader import safe_load_yaml
 from core.models.atomic_task import AtomicTask
 
 
@@ -12,7 +11,7 @@ class AtomicTaskLoader:
         if not task_path.exists():
             raise FileNotFoundError(f"Atomic task file not found: {task_path}")
 
-        data = yaml.safe_load(task_path.read_text(encoding="utf-8"))
+        data = safe_load_yaml(task_path.read_text(encoding="utf-8"))
 
         if not isinstance(data, dict):
             raise ValueError("Atomic task file must contain a YAML mapping.")
@@ -1,9 +1,12 @@
+from dataclasses import fields
 from pathlib import Path
 
-import yaml
-
+from core.helpers.yaml_loader import safe_load_yaml
 from core.models.profile import ProductionProfile
 
+# Keys missing from the profile file fall back to the ProductionProfile defaults.
+_PROFILE_FIELDS = tuple(item.name for item in fields(ProductionProfile))
+
 
 class ProfileLoader:
     def __init__(self, profiles_dir: str = "config/profiles") -> None:
@@ -18,17 +21,9 @@ class ProfileLoader:
         if not profile_path.exists():
             raise FileNotFoundError(f"Profile file not found: {profile_path}")
 
-        data = yaml.safe_load(profile_path.read_text(encoding="utf-8"))
+        data = safe_load_yaml(profile_path.read_text(encoding="utf-8"))
 
         if not isinstance(data, dict):
             raise ValueError(f"Profile file must contain a YAML mapping: {profile_path}")
 
-        return ProductionProfile(
-            llm_model=data.get("llm_model", "gpt-4o-mini"),
-            run_local_tests=data.get("run_local_tests", True),
-            test_command=data.get("test_command", ["pytest"]),
-            pythonpath_root=data.get("pythonpath_root", "."),
-            use_code_formatter=data.get("use_code_formatter", False),
-            formatter_command=data.get("formatter_command", []),
-            fail_on_quality_error=data.get("fail_on_quality_error", True),
-        )
+        return ProductionProfile(**{name: data[name] for name in _PROFILE_FIELDS if name in data})
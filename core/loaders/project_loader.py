@@ -1,9 +1,12 @@
+from dataclasses import fields
 from pathlib import Path
 
-import yaml
-
+from core.helpers.yaml_loader import safe_load_yaml
 from core.models.project_context import ProjectContext
 
+# Keys missing from the project config fall back to the ProjectContext defaults.
+_PROJECT_FIELDS = tuple(item.name for item in fields(ProjectContext) if item.name != "root_path")
+
 
 class ProjectLoader:
     def load(self, path: str) -> ProjectContext:
@@ -12,7 +15,7 @@ class ProjectLoader:
         if not project_path.exists():
             raise FileNotFoundError(f"Project config not found: {project_path}")
 
-        data = yaml.safe_load(project_path.read_text(encoding="utf-8"))
+        data = safe_load_yaml(project_path.read_text(encoding="utf-8"))
 
         if not isinstance(data, dict):
             raise ValueError("Project config must contain a YAML mapping.")
@@ -21,8 +24,5 @@ class ProjectLoader:
 
         return ProjectContext(
             root_path=root_path,
-            pythonpath_root=data.get("pythonpath_root", "."),
-            source_roots=data.get("source_roots", []),
-            test_roots=data.get("test_roots", []),
-            protected_files=data.get("protected_files", []),
+            **{name: data[name] for name in _PROJECT_FIELDS if name in data},
         )
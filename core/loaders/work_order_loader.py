@@ -1,7 +1,6 @@
 from pathlib import Path
 
-import yaml
-
+from core.helpers.yaml_loader import safe_load_yaml
 from core.models.work_order import WorkOrder
 from core.models.work_order_type import WorkOrderType
 
@@ -13,7 +12,7 @@ class WorkOrderLoader:
         if not work_order_path.exists():
             raise FileNotFoundError(f"Work order file not found: {work_order_path}")
 
-        data = yaml.safe_load(work_order_path.read_text(encoding="utf-8"))
+        data = safe_load_yaml(work_order_path.read_text(encoding="utf-8"))
 
         if not isinstance(data, dict):
             raise ValueError("Work order file must contain a YAML mapping.")
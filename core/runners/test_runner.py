@@ -6,7 +6,9 @@ from core.models.context import ProductionContext
 
 class TestRunner:
     def run(self, context: ProductionContext) -> ProductionContext:
-        if not context.profile.run_local_tests:
+        profile = context.profile
+
+        if not profile.run_local_tests:
             print("Skipping local tests because run_local_tests is disabled.")
             return context
 
@@ -14,18 +16,18 @@ class TestRunner:
 
         existing_pythonpath = env.get("PYTHONPATH", "")
         env["PYTHONPATH"] = (
-            context.profile.pythonpath_root
+            profile.pythonpath_root
             if not existing_pythonpath
-            else f"{context.profile.pythonpath_root}{os.pathsep}{existing_pythonpath}"
+            else f"{profile.pythonpath_root}{os.pathsep}{existing_pythonpath}"
         )
 
         print(
-            f"Running tests with PYTHONPATH={context.profile.pythonpath_root}: "
-            f"{' '.join(context.profile.test_command)}"
+            f"Running tests with PYTHONPATH={profile.pythonpath_root}: "
+            f"{' '.join(profile.test_command)}"
         )
 
         result = subprocess.run(  # nosec B603
-            context.profile.test_command,
+            profile.test_command,
             env=env,
             check=False,
         )
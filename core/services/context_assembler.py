@@ -17,7 +17,9 @@ class ContextAssembler:
             if not file_path.exists():
                 raise FileNotFoundError(f"Context file not found: {relative_path}")
 
-            content = file_path.read_text(encoding="utf-8")
+            # One extra character is enough for _truncate to detect overflow.
+            with file_path.open(encoding="utf-8") as handle:
+                content = handle.read(self.max_chars_per_file + 1)
 
             truncated = self._truncate(content)
 
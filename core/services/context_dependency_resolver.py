@@ -4,6 +4,21 @@ from core.models.context_dependency import ContextDependency, ContextDependencyR
 from core.models.project_context import ProjectContext
 from core.models.target_analysis import TargetAnalysis
 
+_EXACT_CANDIDATE_MAP = {
+    "context.work_order": "core/models/work_order.py",
+    "context.project": "core/models/project_context.py",
+    "context.profile": "core/models/profile.py",
+    "context.blueprint": "core/models/blueprint.py",
+}
+
+_ROOT_CANDIDATE_MAP = {
+    "context": "core/models/context.py",
+    "project": "core/models/project_context.py",
+    "work_order": "core/models/work_order.py",
+    "profile": "core/models/profile.py",
+    "blueprint": "core/models/blueprint.py",
+}
+
 
 class ContextDependencyResolver:
     def resolve(
@@ -14,6 +29,7 @@ class ContextDependencyResolver:
     ) -> ContextDependencyResolution:
         dependencies: list[ContextDependency] = []
         seen_paths: set[str] = set()
+        path_exists_cache: dict[str, bool] = {}
 
         self._add_dependency(
             dependencies=dependencies,
@@ -33,7 +49,7 @@ class ContextDependencyResolver:
             )
 
         for symbol in analysis.referenced_symbols:
-            inferred_path = self._infer_path_from_symbol(symbol, project)
+            inferred_path = self._infer_path_from_symbol(symbol, project, path_exists_cache)
             if inferred_path is None:
                 continue
 
@@ -45,8 +61,13 @@ class ContextDependencyResolver:
                 priority="helpful",
             )
 
-        required_read_files = [item.path for item in dependencies if item.priority == "required"]
-        helpful_read_files = [item.path for item in dependencies if item.priority == "helpful"]
+        required_read_files: list[str] = []
+        helpful_read_files: list[str] = []
+        for item in dependencies:
+            if item.priority == "required":
+                required_read_files.append(item.path)
+            elif item.priority == "helpful":
+                helpful_read_files.append(item.path)
 
         return ContextDependencyResolution(
             required_read_files=required_read_files,
@@ -81,39 +102,36 @@ class ContextDependencyResolver:
         self,
         symbol: str,
         project: ProjectContext,
+        path_exists_cache: dict[str, bool],
     ) -> Optional[str]:
         symbol = symbol.strip()
         if not symbol:
             return None
 
-        exact_candidate_map = {
-            "context.work_order": "core/models/work_order.py",
-            "context.project": "core/models/project_context.py",
-            "context.profile": "core/models/profile.py",
-            "context.blueprint": "core/models/blueprint.py",
-        }
-
-        for prefix, candidate in exact_candidate_map.items():
-            if symbol == prefix or symbol.startswith(prefix + "."):
-                if project.resolve(candidate).exists():
-                    return candidate
-                return None
-
-        left_part = symbol.split(".", 1)[0]
-
-        root_candidate_map = {
-            "context": "core/models/context.py",
-            "project": "core/models/project_context.py",
-            "work_order": "core/models/work_order.py",
-            "profile": "core/models/profile.py",
-            "blueprint": "core/models/blueprint.py",
-        }
-
-        candidate = root_candidate_map.get(left_part)
+        parts = symbol.split(".", 2)
+
+        candidate = _EXACT_CANDIDATE_MAP.get(".".join(parts[:2]))
+        if candidate is not None:
+            if self._candidate_exists(project, candidate, path_exists_cache):
+                return candidate
+            return None
+
+        candidate = _ROOT_CANDIDATE_MAP.get(parts[0])
         if candidate is None:
             return None
 
-        if not project.resolve(candidate).exists():
+        if not self._candidate_exists(project, candidate, path_exists_cache):
             return None
 
         return candidate
+
+    def _candidate_exists(
+        self,
+        project: ProjectContext,
+        candidate: str,
+        path_exists_cache: dict[str, bool],
+    ) -> bool:
+        if candidate not in path_exists_cache:
+            path_exists_cache[candidate] = project.resolve(candidate).exists()
+
+        return path_exists_cache[candidate]
@@ -32,16 +32,17 @@ class PromptBuilder:
         )
 
         test_only_instruction = ""
+        target_path = payload.get("target_path")
         if (
             blueprint.component_type == "unit_test"
-            and "target_path" in payload
-            and payload["target_path"] not in work_order.writable_files
+            and target_path is not None
+            and target_path not in work_order.writable_files
         ):
             test_only_instruction = (
                 "\n# Test-Only Rule\n"
                 "- This is a test-only request.\n"
                 "- Do not return production source files.\n"
-                f"- Do not return this read-only target file as output: {payload['target_path']}\n"
+                f"- Do not return this read-only target file as output: {target_path}\n"
             )
 
         context.prompt_text = f"""# Role
@@ -92,6 +92,7 @@ class TargetInspector:
         current_file_path: str,
     ) -> list[str]:
         resolved: list[str] = []
+        seen: set[str] = set()
 
         for item in imports:
             candidates = self._build_candidate_paths(
@@ -102,7 +103,8 @@ class TargetInspector:
 
             for candidate in candidates:
                 if project.resolve(candidate).exists():
-                    if candidate not in resolved:
+                    if candidate not in seen:
+                        seen.add(candidate)
                         resolved.append(candidate)
                     break
 
@@ -131,8 +133,7 @@ class TargetInspector:
             candidates.append(f"{module_path}.py")
             candidates.append(f"{module_path}/__init__.py")
 
-        for imported_name in item.imported_names:
-            if module_path:
+            for imported_name in item.imported_names:
                 candidates.append(f"{module_path}/{imported_name}.py")
 
         return candidates
@@ -167,6 +168,7 @@ class TargetInspector:
 
     def _extract_parameter_type_names(self, node: ast.FunctionDef) -> list[str]:
         type_names: list[str] = []
+        seen: set[str] = set()
 
         all_args = list(node.args.posonlyargs) + list(node.args.args) + list(node.args.kwonlyargs)
 
@@ -175,7 +177,8 @@ class TargetInspector:
                 continue
 
             annotation_name = self._annotation_to_name(arg.annotation)
-            if annotation_name and annotation_name not in type_names:
+            if annotation_name and annotation_name not in seen:
+                seen.add(annotation_name)
                 type_names.append(annotation_name)
 
         return type_names
@@ -209,13 +212,15 @@ class TargetInspector:
 
     def _extract_referenced_attribute_names(self, node: ast.FunctionDef) -> list[str]:
         names: list[str] = []
+        seen: set[str] = set()
 
         for child in ast.walk(node):
             if isinstance(child, ast.Attribute):
                 if isinstance(child.value, ast.Name):
                     value_name = child.value.id
                     full_name = f"{value_name}.{child.attr}"
-                    if full_name not in names:
+                    if full_name not in seen:
+                        seen.add(full_name)
                         names.append(full_name)
 
         return names
@@ -225,18 +230,18 @@ class TargetInspector:
         method_analyses: list[MethodAnalysis],
     ) -> list[str]:
         symbols: list[str] = []
+        seen: set[str] = set()
 
         for analysis in method_analyses:
-            for type_name in analysis.parameter_type_names:
-                if type_name not in symbols:
-                    symbols.append(type_name)
-
-            if analysis.return_type_name and analysis.return_type_name not in symbols:
-                symbols.append(analysis.return_type_name)
+            names = list(analysis.parameter_type_names)
+            if analysis.return_type_name:
+                names.append(analysis.return_type_name)
+            names.extend(analysis.referenced_attribute_names)
 
-            for attr_name in analysis.referenced_attribute_names:
-                if attr_name not in symbols:
-                    symbols.append(attr_name)
+            for name in names:
+                if name not in seen:
+                    seen.add(name)
+                    symbols.append(name)
 
         return symbols
 
@@ -256,11 +261,12 @@ class TargetInspector:
 
         if item.module:
             module_path = item.module.replace(".", "/")
+            module_dir = base_dir / module_path
             candidates.append(str(base_dir / f"{module_path}.py"))
-            candidates.append(str(base_dir / module_path / "__init__.py"))
+            candidates.append(str(module_dir / "__init__.py"))
 
             for imported_name in item.imported_names:
-                candidates.append(str(base_dir / module_path / f"{imported_name}.py"))
+                candidates.append(str(module_dir / f"{imported_name}.py"))
         else:
             for imported_name in item.imported_names:
                 candidates.append(str(base_dir / f"{imported_name}.py"))
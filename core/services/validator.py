@@ -86,6 +86,7 @@ class Validator:
             if not project.resolve(relative_path).exists():
                 raise ValueError(f"Read file does not exist: {relative_path}")
 
+        protected_files = set(project.protected_files)
         for relative_path in work_order.writable_files:
-            if relative_path in project.protected_files:
+            if relative_path in protected_files:
                 raise ValueError(f"Protected file cannot be writable: {relative_path}")
@@ -36,10 +36,11 @@ class WorkOrderDraftBuilder:
             blueprint=blueprint,
         )
 
-        read_files = list(dependency_resolution.required_read_files)
-        for path in dependency_resolution.helpful_read_files:
-            if path not in read_files:
-                read_files.append(path)
+        read_files = list(
+            dict.fromkeys(
+                dependency_resolution.required_read_files + dependency_resolution.helpful_read_files
+            )
+        )
 
         return WorkOrder(
             request_id=request.request_id,
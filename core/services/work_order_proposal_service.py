@@ -1,5 +1,6 @@
 import shutil
 from pathlib import Path
+from typing import Optional
 
 from core.blueprints.catalog import register_blueprints
 from core.loaders.atomic_task_loader import AtomicTaskLoader
@@ -27,7 +28,8 @@ class WorkOrderProposalService:
         self.project_loader = ProjectLoader()
         self.profile_loader = ProfileLoader()
         self.prompt_builder = WorkOrderProposalPromptBuilder()
-        self.executor = WorkOrderProposalExecutor()
+        # Created on first use so promoting a proposal needs no LLM client.
+        self.executor: Optional[WorkOrderProposalExecutor] = None
         self.writer = WorkOrderProposalWriter()
         self.target_inspector = TargetInspector()
         self.dependency_resolver = ContextDependencyResolver()
@@ -71,10 +73,11 @@ class WorkOrderProposalService:
             analysis=analysis,
         )
 
-        suggested_read_files = list(dependency_resolution.required_read_files)
-        for path in dependency_resolution.helpful_read_files:
-            if path not in suggested_read_files:
-                suggested_read_files.append(path)
+        suggested_read_files = list(
+            dict.fromkeys(
+                dependency_resolution.required_read_files + dependency_resolution.helpful_read_files
+            )
+        )
 
         suggested_writable_files = [test_path]
 
@@ -108,6 +111,9 @@ class WorkOrderProposalService:
             suggested_writable_files=suggested_writable_files,
         )
 
+        if self.executor is None:
+            self.executor = WorkOrderProposalExecutor()
+
         proposal_text = self.executor.generate(
             model=profile.llm_model,
             prompt=prompt,
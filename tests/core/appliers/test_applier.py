@@ -1,5 +1,7 @@
 import importlib
 
+from core.appliers.applier import OutputApplier
+
 
 def test_import_applier_module():
     module = importlib.import_module("core.appliers.applier")
@@ -9,3 +11,15 @@ def test_import_applier_module():
 def test_applier_exports_expected_symbols():
     module = importlib.import_module("core.appliers.applier")
     assert hasattr(module, "OutputApplier")
+
+
+def test_applier_allows_blank_lines_after_file_header():
+    content = "### FILE: out.py\n\n```python\nprint(1)\nprint(2)\n```\n"
+
+    assert OutputApplier()._extract_files(content) == {"out.py": "print(1)\nprint(2)"}
+
+
+def test_applier_file_header_does_not_span_lines():
+    content = "### FILE: a.py\nprose\n### FILE: out.py\n```python\nprint('x')\n```\n"
+
+    assert OutputApplier()._extract_files(content) == {"out.py": "print('x')"}
@@ -52,3 +52,44 @@ def test_output_checker_edge_cases(tmp_path, monkeypatch):
         checker.run(ctx)
 
     assert "Python file block is empty: out.py" in checker._check_python_file("out.py", "")
+
+
+def test_output_checker_file_header_does_not_span_lines():
+    content = "### FILE: a.py\nprose\n### FILE: out.py\n```python\nprint('x')\n```"
+
+    assert OutputChecker()._extract_files(content) == {"out.py": "print('x')"}
+
+
+def test_output_checker_allows_blank_lines_after_file_header():
+    content = "### FILE: out.py\n\n```python\nprint(1)\nprint(2)\n```\n"
+
+    assert OutputChecker()._extract_files(content) == {"out.py": "print(1)\nprint(2)"}
+
+
+def test_output_checker_rejects_indented_fence():
+    content = "### FILE: out.py\n  ```python\nx = 1\n  ```\n"
+
+    assert OutputChecker()._extract_files(content) == {}
+
+
+def test_output_checker_returns_no_files_without_block_marker():
+    assert OutputChecker()._extract_files("I cannot help with that.\n```python\n```") == {}
+
+
+def test_output_checker_reports_missing_and_unexpected_blocks(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    base = tmp_path / ".codegen" / "requests" / "r"
+    base.mkdir(parents=True)
+    (base / "response.md").write_text(
+        "### FILE: b.py\n```python\nx = 1\n```\n### FILE: a.py\n```python\ny = 2\n```",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError):
+        OutputChecker().run(_context(tmp_path))
+
+    output = capsys.readouterr().out
+    assert "- Missing output file block: out.py" in output
+    assert output.index("Unexpected output file block: a.py") < output.index(
+        "Unexpected output file block: b.py"
+    )
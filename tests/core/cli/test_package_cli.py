@@ -1,4 +1,7 @@
 import importlib
+import subprocess
+import sys
+from pathlib import Path
 
 
 def test_import_package_cli_module():
@@ -9,3 +12,21 @@ def test_import_package_cli_module():
 def test_package_cli_exports_main():
     module = importlib.import_module("cirobotix.cli")
     assert hasattr(module, "main")
+
+
+def test_package_cli_import_does_not_load_work_order_services():
+    # A fresh interpreter, so modules other tests already imported cannot hide a regression.
+    script = (
+        "import sys, cirobotix.cli; "
+        "print(sorted(name for name in ('yaml', 'core.services.work_order_cli_service', "
+        "'core.services.work_order_proposal_service') if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[3],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
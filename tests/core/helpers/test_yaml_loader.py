@@ -0,0 +1,33 @@
+import importlib
+
+import yaml
+
+from core.helpers.yaml_loader import safe_load_yaml
+
+
+def test_import_yaml_loader_module():
+    module = importlib.import_module("core.helpers.yaml_loader")
+    assert module is not None
+
+
+def test_yaml_loader_exports_expected_symbols():
+    module = importlib.import_module("core.helpers.yaml_loader")
+    assert hasattr(module, "safe_load_yaml")
+    assert hasattr(module, "YAML_SAFE_LOADER")
+
+
+def test_safe_load_yaml_parses_mapping():
+    assert safe_load_yaml("a: 1\nitems:\n  - x\n") == {"a": 1, "items": ["x"]}
+
+
+def test_safe_load_yaml_falls_back_without_libyaml(monkeypatch):
+    module = importlib.import_module("core.helpers.yaml_loader")
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+
+    try:
+        reloaded = importlib.reload(module)
+        assert reloaded.YAML_SAFE_LOADER is yaml.SafeLoader
+        assert reloaded.safe_load_yaml("a: 1") == {"a": 1}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(module)
@@ -1,5 +1,8 @@
 import importlib
 
+from core.loaders.profile_loader import ProfileLoader
+from core.models.profile import ProductionProfile
+
 
 def test_import_profile_loader_module():
     module = importlib.import_module("core.loaders.profile_loader")
@@ -9,3 +12,11 @@ def test_import_profile_loader_module():
 def test_profile_loader_exports_expected_symbols():
     module = importlib.import_module("core.loaders.profile_loader")
     assert hasattr(module, "ProfileLoader")
+
+
+def test_profile_loader_uses_model_defaults_and_ignores_unknown_keys(tmp_path):
+    (tmp_path / "partial.yaml").write_text("llm_model: m\nunknown: 1\n", encoding="utf-8")
+
+    profile = ProfileLoader(str(tmp_path)).load("partial")
+
+    assert profile == ProductionProfile(llm_model="m")
@@ -1,5 +1,8 @@
 import importlib
 
+from core.loaders.project_loader import ProjectLoader
+from core.models.project_context import ProjectContext
+
 
 def test_import_project_loader_module():
     module = importlib.import_module("core.loaders.project_loader")
@@ -9,3 +12,14 @@ def test_import_project_loader_module():
 def test_project_loader_exports_expected_symbols():
     module = importlib.import_module("core.loaders.project_loader")
     assert hasattr(module, "ProjectLoader")
+
+
+def test_project_loader_uses_model_defaults_and_ignores_unknown_keys(tmp_path):
+    config_path = tmp_path / "project.yaml"
+    config_path.write_text(
+        f"root_path: {tmp_path}\nsource_roots: [core]\nextra: x\n", encoding="utf-8"
+    )
+
+    project = ProjectLoader().load(str(config_path))
+
+    assert project == ProjectContext(root_path=tmp_path.resolve(), source_roots=["core"])
@@ -43,3 +43,15 @@ def test_context_assembler_missing_file_and_truncate(tmp_path):
 
     assembler = ContextAssembler(max_chars_per_file=3)
     assert assembler._truncate("abcdef").endswith("# ... truncated ...")
+
+
+def test_context_assembler_truncates_large_files(tmp_path):
+    (tmp_path / "big.py").write_text("x" * 50, encoding="utf-8")
+    (tmp_path / "exact.py").write_text("y" * 10, encoding="utf-8")
+    ctx = _context(tmp_path, ["big.py", "exact.py"])
+
+    assembled = ContextAssembler(max_chars_per_file=10).run(ctx).assembled_context or ""
+
+    assert "x" * 10 + "\n# ... truncated ..." in assembled
+    assert "x" * 11 not in assembled
+    assert "y" * 10 + "\n```" in assembled
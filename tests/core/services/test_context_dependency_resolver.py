@@ -21,23 +21,59 @@ def test_context_dependency_resolver_happy_and_edge_cases(tmp_path):
 
     assert "core/x.py" in result.required_read_files
     assert any(dep.priority == "helpful" for dep in result.dependencies)
-    assert resolver._infer_path_from_symbol("", ProjectContext(root_path=tmp_path)) is None
-    assert resolver._infer_path_from_symbol("abc.def", ProjectContext(root_path=tmp_path)) is None
+    assert resolver._infer_path_from_symbol("", ProjectContext(root_path=tmp_path), {}) is None
     assert (
-        resolver._infer_path_from_symbol("context.work_order", ProjectContext(root_path=tmp_path))
+        resolver._infer_path_from_symbol("abc.def", ProjectContext(root_path=tmp_path), {}) is None
+    )
+    assert (
+        resolver._infer_path_from_symbol(
+            "context.work_order", ProjectContext(root_path=tmp_path), {}
+        )
         == "core/models/work_order.py"
     )
 
     (tmp_path / "core/models/work_order.py").unlink()
     assert (
-        resolver._infer_path_from_symbol("context.work_order", ProjectContext(root_path=tmp_path))
+        resolver._infer_path_from_symbol(
+            "context.work_order", ProjectContext(root_path=tmp_path), {}
+        )
         is None
     )
     assert (
-        resolver._infer_path_from_symbol("context.any", ProjectContext(root_path=tmp_path))
+        resolver._infer_path_from_symbol("context.any", ProjectContext(root_path=tmp_path), {})
         == "core/models/context.py"
     )
     (tmp_path / "core/models/context.py").unlink()
     assert (
-        resolver._infer_path_from_symbol("context.any", ProjectContext(root_path=tmp_path)) is None
+        resolver._infer_path_from_symbol("context.any", ProjectContext(root_path=tmp_path), {})
+        is None
+    )
+
+
+def test_infer_path_from_symbol_matches_nested_exact_prefix(tmp_path):
+    (tmp_path / "core/models").mkdir(parents=True)
+    for name in ["context.py", "work_order.py"]:
+        (tmp_path / "core/models" / name).write_text("x", encoding="utf-8")
+
+    resolver = ContextDependencyResolver()
+    project = ProjectContext(root_path=tmp_path)
+
+    assert (
+        resolver._infer_path_from_symbol("context.work_order.payload", project, {})
+        == "core/models/work_order.py"
+    )
+    assert resolver._infer_path_from_symbol("context.work_orders", project, {}) == (
+        "core/models/context.py"
+    )
+
+
+def test_infer_path_from_symbol_reuses_path_exists_cache(tmp_path):
+    resolver = ContextDependencyResolver()
+    project = ProjectContext(root_path=tmp_path)
+    cache = {"core/models/context.py": True}
+
+    assert resolver._infer_path_from_symbol("context.any", project, cache) == (
+        "core/models/context.py"
     )
+    assert resolver._infer_path_from_symbol("project.any", project, cache) is None
+    assert cache == {"core/models/context.py": True, "core/models/project_context.py": False}
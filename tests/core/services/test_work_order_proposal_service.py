@@ -19,19 +19,14 @@ class DummyRegistry:
         return self.blueprint
 
 
-def test_init_and_create_registry(monkeypatch):
-    import core.services.work_order_proposal_service as mod
-
-    monkeypatch.setattr(
-        mod, "WorkOrderProposalExecutor", lambda: SimpleNamespace(generate=lambda **_: "x")
-    )
+def test_init_and_create_registry():
     service = WorkOrderProposalService()
     registry = service.create_registry()
     assert registry is not None
+    assert service.executor is None
 
 
-def test_create_ai_proposal_happy_path(tmp_path):
-    svc = WorkOrderProposalService.__new__(WorkOrderProposalService)
+def _stub_proposal_dependencies(svc, tmp_path):
     blueprint = Blueprint(
         name="python_pytest_unit_test",
         component_type="unit_test",
@@ -70,9 +65,14 @@ def test_create_ai_proposal_happy_path(tmp_path):
     )
     svc.context_assembler = SimpleNamespace(run=lambda ctx: ctx)
     svc.prompt_builder = SimpleNamespace(build=lambda **_: "PROMPT")
-    svc.executor = SimpleNamespace(generate=lambda **_: "proposal: yaml")
     svc.writer = SimpleNamespace(write=lambda **_: Path(".codegen/requests/t1/proposal.yaml"))
 
+
+def test_create_ai_proposal_happy_path(tmp_path):
+    svc = WorkOrderProposalService.__new__(WorkOrderProposalService)
+    _stub_proposal_dependencies(svc, tmp_path)
+    svc.executor = SimpleNamespace(generate=lambda **_: "proposal: yaml")
+
     result = svc.create_ai_proposal(task_path="x.yaml")
 
     assert result.endswith("proposal.yaml")
@@ -103,3 +103,25 @@ def test_promote_proposal_happy_path(tmp_path):
 
     assert Path(promoted).exists()
     assert (proposal.parent / "review.md").exists()
+
+
+def test_executor_is_created_only_when_generating(monkeypatch, tmp_path):
+    import core.services.work_order_proposal_service as mod
+
+    created = []
+
+    def fake_executor():
+        created.append(True)
+        return SimpleNamespace(generate=lambda **_: "proposal: yaml")
+
+    monkeypatch.setattr(mod, "WorkOrderProposalExecutor", fake_executor)
+    svc = WorkOrderProposalService()
+    _stub_proposal_dependencies(svc, tmp_path)
+
+    assert svc.executor is None
+    assert created == []
+
+    svc.create_ai_proposal(task_path="x.yaml")
+    svc.create_ai_proposal(task_path="x.yaml")
+
+    assert created == [True]